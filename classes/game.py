@@ -18,11 +18,12 @@ class Game():
         player2_throw (dict): The choice of player 2
         winner (str): The name of the winning player
         game_result (str): Result of the game
+        rng (CounterRNG): The stream the throws are drawn from, or None
 
     Methods:
         play_game(self): Play the game using the inputted game_id and players
     """
-    def __init__(self, game_id, player1, player2):
+    def __init__(self, game_id, player1, player2, rng=None):
         """
         This method initializes the player with the game_id and players, then
         plays out the game.
@@ -32,10 +33,12 @@ class Game():
             :param game_id: The game id as an int
             :param player_1: The first player as a Player
             :param player_2: The second player as a Player
+            :param rng: The CounterRNG stream of this game. Default=None
         """
         self.game_id = game_id
         self.player1 = player1
         self.player2 = player2
+        self.rng = rng
         self.winner = self.play_game()
 
     def play_game(self):
@@ -49,8 +52,8 @@ class Game():
         Returns:
             str: The name of the winner
         """
-        self.player1_throw = self.player1.throw()
-        self.player2_throw = self.player2.throw()
+        self.player1_throw = self.player1.throw(self.rng)
+        self.player2_throw = self.player2.throw(self.rng)
 
         # Resolve game
         # Tie - Easiest
@@ -18,14 +18,28 @@ class Match():
         games (list): A list of all of the games(Game) played in the match
         games_played (int): The number of games played in the match
         winner (str): Name of the winner of the match
+        rng (CounterRNG): The stream of the match, or None
 
     Methods:
         play_match(self): Plays out the match and determines the winner
     """
-    def __init__(self, player1, player2, wins_needed):
+    def __init__(self, player1, player2, wins_needed, rng=None):
+        """
+        Initializes the match.
+
+        Arguments:
+            :param self: This object
+            :param player1: The first player as a Player
+            :param player2: The second player as a Player
+            :param wins_needed: The number of wins needed to win the match
+            :param rng: The CounterRNG stream of the match. Each game draws
+                        from its own stream keyed by the game number.
+                        Default=None
+        """
         self.player1 = player1
         self.player2 = player2
         self.wins_needed = wins_needed
+        self.rng = rng
 
     def play_match(self):
         """
@@ -50,7 +64,8 @@ class Match():
         loop = True
         while(loop):
             self.games_played += 1
-            game = Game(self.games_played, self.player1, self.player2)
+            game_rng = None if self.rng is None else self.rng.stream(self.games_played)
+            game = Game(self.games_played, self.player1, self.player2, game_rng)
             print(game)
             if(game.winner == self.player1.name):
                 self.player1.wins += 1
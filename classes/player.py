@@ -18,7 +18,7 @@ class Player():
         losses (int): Number of games lost
 
     Methods:
-        throw(self): Throws rock, paper, or scissors.
+        throw(self, rng): Throws rock, paper, or scissors.
     """
     def __init__(self, name):
         """
@@ -45,7 +45,7 @@ class Player():
         """
         return self.name
 
-    def throw(self):
+    def throw(self, rng=None):
         """
         This method is used to actually play rock, paper, scissors. It throws
         one of the available options in the form:
@@ -56,10 +56,15 @@ class Player():
 
         Arguments:
             :param self: The object
+            :param rng: The CounterRNG stream to draw from. Default=None uses
+                        the global random state
 
         Returns:
             dict: A dictionary containing the int representation and the
                   string representation of the choice thrown.
         """
-        choice = randint(1, len(self.options))
+        if(rng is None):
+            choice = randint(1, len(self.options))
+        else:
+            choice = rng.randint(1, len(self.options))
         return {'choice': choice, 'str': self.options[choice]}
\ No newline at end of file
@@ -0,0 +1,125 @@
+"""classes.rng
+
+This module contains the CounterRNG class and the stream keys used by the
+tourney.
+
+"""
+from hashlib import blake2b
+from struct import pack
+
+# Stream keys for each part of the tourney. A match is keyed by one of these,
+# then the stage and match number, and a game by the game number below that.
+SEEDING = 0
+UPPER = 1
+LOWER_MINOR = 2
+LOWER_MAJOR = 3
+CHAMPIONSHIP = 4
+VICTORY = 5
+
+MASK64 = (1 << 64) - 1
+
+
+class CounterRNG():
+    """
+    A counter based random number generator. Every number drawn is a hash of
+    the seed, the key of the stream and the number of draws made so far, so
+    any stream can be rebuilt directly from its key without replaying the
+    streams that came before it.
+
+    Attributes:
+        seed (int): The 64 bit seed of the tourney
+        key (tuple): The ints identifying this stream
+        counter (int): The number of raw values drawn from this stream
+
+    Methods:
+        stream(self, *key): Makes a child stream keyed below this one
+        random_bits(self): Draws a raw 64 bit value
+        randint(self, a, b): Draws an int in the range [a, b]
+        shuffle(self, items): Shuffles a list in place
+    """
+    def __init__(self, seed, *key):
+        """
+        Initializes the stream.
+
+        Arguments:
+            :param self: The object
+            :param seed: The seed of the tourney as an int
+            :param key: The ints identifying this stream
+        """
+        self.seed = seed & MASK64
+        self.key = tuple(key)
+        self.counter = 0
+
+    def __repr__(self):
+        """
+        Returns a string representation of the stream.
+
+        Arguments:
+            :param self: The object
+
+        Returns:
+            str: The string representation
+        """
+        return '<CounterRNG - seed {} key {} counter {}>'.format(self.seed, self.key, self.counter)
+
+    def stream(self, *key):
+        """
+        This method makes a new stream whose key is this stream's key followed
+        by the given key. The new stream starts at counter 0.
+
+        Arguments:
+            :param self: The object
+            :param key: The ints to add to the key
+
+        Returns:
+            CounterRNG: The child stream
+        """
+        return CounterRNG(self.seed, *(self.key + tuple(key)))
+
+    def random_bits(self):
+        """
+        This method draws the next raw value from the stream and advances the
+        counter.
+
+        Arguments:
+            :param self: The object
+
+        Returns:
+            int: A value in the range [0, 2**64)
+        """
+        words = (self.seed, len(self.key)) + self.key + (self.counter,)
+        data = pack('>{}Q'.format(len(words)), *(x & MASK64 for x in words))
+        self.counter += 1
+        return int.from_bytes(blake2b(data, digest_size=8).digest(), 'big')
+
+    def randint(self, a, b):
+        """
+        This method draws an int in the range [a, b], including both end
+        points. Values that would bias the result are rejected and redrawn.
+
+        Arguments:
+            :param self: The object
+            :param a: The lowest value as an int
+            :param b: The highest value as an int
+
+        Returns:
+            int: The value drawn
+        """
+        span = b - a + 1
+        limit = (1 << 64) - ((1 << 64) % span)
+        value = self.random_bits()
+        while(value >= limit):
+            value = self.random_bits()
+        return a + value % span
+
+    def shuffle(self, items):
+        """
+        This method shuffles a list in place using Fisher-Yates.
+
+        Arguments:
+            :param self: The object
+            :param items: The list to shuffle
+        """
+        for i in range(len(items) - 1, 0, -1):
+            j = self.randint(0, i)
+            items[i], items[j] = items[j], items[i]
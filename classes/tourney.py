@@ -8,8 +8,9 @@ from anytree.render import AsciiStyle
 from classes.game import Game
 from classes.match import Match
 from classes.player import Player
+from classes.rng import CHAMPIONSHIP, LOWER_MAJOR, LOWER_MINOR, SEEDING, UPPER, VICTORY, CounterRNG
 from math import log2
-from random import randint, shuffle
+from random import getrandbits
 
 
 class Tourney():
@@ -25,8 +26,11 @@ class Tourney():
         stages (int): The number of stages in the tourney
         upper_bracket (Node): The upper bracket tree
         lower_bracket (Node): The lower bracket tree
+        seed (int): The seed of the tourney
+        rng (CounterRNG): The root stream that all others are keyed from
 
     Methods:
+        match_rng(self, bracket, stage, match): Makes the stream for a match
         make_upper_tree(self, stage, root): Makes upper bracket
         make_lower_tree(self, stage, root): Makes lower bracket
         print_brackets(self): Prints both brackets
@@ -37,7 +41,7 @@ class Tourney():
         run_championship(self): Runs the championship
         victory_screen(self, victor): Creates the victory screen for the winner
     """
-    def __init__(self, players, wins_needed=2):
+    def __init__(self, players, wins_needed=2, seed=None):
         """
         This method initializes the Tourney Class. We will create the upper and
         lower brackets as well as the players in the tounrey. Raises an 
@@ -47,6 +51,8 @@ class Tourney():
             :param self: This object
             :param players: A list of strings of names of players
             :param wins_needed: Number of wins needed to win a match. Default=2
+            :param seed: The seed of the tourney as an int. Default=None picks
+                         a random seed
 
         Raises:
             Exception: The number of players is not a power of 2
@@ -54,6 +60,8 @@ class Tourney():
         self.players = []
         self.matches = []
         self.wins_needed = wins_needed
+        self.seed = getrandbits(64) if seed is None else seed
+        self.rng = CounterRNG(self.seed)
         num_players = len(players)
 
         # Make sure we are a power of 2
@@ -61,6 +69,7 @@ class Tourney():
             self.stages = int(log2(num_players))
 
             print('Making a bracket with {} Stages'.format(self.stages))
+            print('Tourney seed: {}'.format(self.seed))
 
             # Recursively make the trees
             self.upper_bracket = self.make_upper_tree(self.stages, Node('Stage{}'.format(self.stages+1), contestant='Upper Champ', player=None))
@@ -70,7 +79,7 @@ class Tourney():
                 self.lower_bracket = self.make_lower_tree(self.stages - 1, Node('Stage{}-Major'.format(self.stages), contestant='Lower Champ', player=None))
 
             # Now populate the upper bracket to start
-            shuffle(players)
+            self.rng.stream(SEEDING).shuffle(players)
             groups = zip(findall(self.upper_bracket, filter_=lambda node: node.name in ('Stage1')), players)
             for node, player in groups:
                 node.contestant = player
@@ -83,6 +92,23 @@ class Tourney():
         else:
             raise Exception('{} is not a power of 2'.format(num_players))
         
+    def match_rng(self, bracket, stage, match):
+        """
+        This method makes the stream for a match. The stream only depends on
+        the seed and the given keys, so a match can be replayed without
+        running the rest of the tourney.
+
+        Arguments:
+            :param self: This tourney object
+            :param bracket: The bracket key from classes.rng (UPPER, etc.)
+            :param stage: The stage of the match
+            :param match: The number of the match in the stage
+
+        Returns:
+            CounterRNG: The stream of the match
+        """
+        return self.rng.stream(bracket, stage, match)
+
     def make_upper_tree(self, stage, root):
         """
         This method creates the upper tree. It recursively traverses down to 
@@ -194,7 +220,7 @@ class Tourney():
             num_match = 1
             for node in nodes:
                 player1, player2 = (x.player for x in node.children)
-                cur_match = Match(player1, player2, self.wins_needed)
+                cur_match = Match(player1, player2, self.wins_needed, self.match_rng(UPPER, stage_num, num_match))
 
                 print('Match {} - {} v. {}'.format(num_match, player1.name, player2.name))
                 print('---------------------------------')
@@ -269,7 +295,7 @@ class Tourney():
                 for node in nodes:
                     print(node)
                     player1, player2 = (x.player for x in node.children)
-                    cur_match = Match(player1, player2, self.wins_needed)
+                    cur_match = Match(player1, player2, self.wins_needed, self.match_rng(LOWER_MINOR, stage_num, num_match))
 
                     print('Match {} - {} v. {}'.format(num_match, player1.name, player2.name))
                     print('---------------------------------')
@@ -284,6 +310,7 @@ class Tourney():
                     # The loser is done! No more advancement. Move on to the minors.
                     loser = player2 if results['winner'] == player1.name else player1
                     loser.losses += 1
+                    num_match += 1
 
             # Now do the major
             # Find the parents of all children nodes that need played
@@ -291,7 +318,7 @@ class Tourney():
             num_match = 1
             for node in nodes:
                 player1, player2 = (x.player for x in node.children)
-                cur_match = Match(player1, player2, self.wins_needed)
+                cur_match = Match(player1, player2, self.wins_needed, self.match_rng(LOWER_MAJOR, stage_num, num_match))
 
                 print('Match {} - {} v. {}'.format(num_match, player1.name, player2.name))
                 print('---------------------------------')
@@ -306,6 +333,7 @@ class Tourney():
                 # The loser is done! No more advancement. Move on to the minors.
                 loser = player2 if results['winner'] == player1.name else player1
                 loser.losses += 1
+                num_match += 1
 
             # At the end of the stage, print the bracket
             stage_num += 1
@@ -333,7 +361,7 @@ class Tourney():
         print('{} v. {}'.format(upper.name, lower.name))
         print('Match 1')
         print('---------------------------------')
-        cur_match = Match(upper, lower, self.wins_needed)
+        cur_match = Match(upper, lower, self.wins_needed, self.match_rng(CHAMPIONSHIP, 1, 1))
         results = cur_match.play_match()
         self.matches.append(cur_match)
         print('{} wins the match in {} games!\n'.format(results['winner'], results['games_played']))
@@ -346,7 +374,7 @@ class Tourney():
         if(loser.name == upper.name):
             print('\nMatch 2')
             print('---------------------------------')
-            cur_match = Match(upper, lower, self.wins_needed)
+            cur_match = Match(upper, lower, self.wins_needed, self.match_rng(CHAMPIONSHIP, 1, 2))
             results = cur_match.play_match()
             self.matches.append(cur_match)
             print('{} wins the match in {} games!\n'.format(results['winner'], results['games_played']))
@@ -377,4 +405,4 @@ class Tourney():
             '{} is victorious! Huzza!', '{} stomped some noobs.', 'Hail God Emperor {}!',
             'Bless {}! May his passing cleanse the world!'
         ]
-        return victory_options[randint(0, len(victory_options)-1)].format(victor)
\ No newline at end of file
+        return victory_options[self.rng.stream(VICTORY).randint(0, len(victory_options)-1)].format(victor)
\ No newline at end of file
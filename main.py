@@ -5,10 +5,21 @@ import sys
 from classes.tourney import Tourney
 
 
-# Set up tourney
+# Set up tourney. A seed can be given with --seed=N to reproduce a tourney.
+seed = None
+players = []
+for arg in sys.argv[1:]:
+    if(arg.startswith('--seed=')):
+        try:
+            seed = int(arg[len('--seed='):])
+        except ValueError:
+            print('Invalid seed. Must be an integer!')
+            sys.exit(1)
+    else:
+        players.append(arg)
+
 try:
-    players = sys.argv[1:]
-    tourney = Tourney(players)
+    tourney = Tourney(players, seed=seed)
 except:
     print('Invalid Number of players. Must be a power of two!')
     sys.exit(1)
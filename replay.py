@@ -0,0 +1,35 @@
+"""
+Replay a single match of a Rock-Paper-Scissors Tourney
+
+Usage: python replay.py SEED BRACKET STAGE MATCH [WINS_NEEDED]
+
+BRACKET is one of upper, lower-minor, lower-major or championship. The games
+of the match are drawn straight from the tourney seed, so no other match has
+to be played first.
+"""
+import sys
+from classes.match import Match
+from classes.player import Player
+from classes.rng import CHAMPIONSHIP, LOWER_MAJOR, LOWER_MINOR, UPPER, CounterRNG
+
+
+brackets = {
+    'upper': UPPER,
+    'lower-minor': LOWER_MINOR,
+    'lower-major': LOWER_MAJOR,
+    'championship': CHAMPIONSHIP
+}
+
+# Read the match keys
+try:
+    seed, bracket, stage, match = sys.argv[1:5]
+    wins_needed = int(sys.argv[5]) if len(sys.argv) > 5 else 2
+    rng = CounterRNG(int(seed), brackets[bracket], int(stage), int(match))
+except (ValueError, KeyError):
+    print(__doc__)
+    sys.exit(1)
+
+# Player 1 is always the first child of the bracket node
+cur_match = Match(Player('Player 1'), Player('Player 2'), wins_needed, rng)
+results = cur_match.play_match()
+print('{} wins the match in {} games!'.format(results['winner'], results['games_played']))
\ No newline at end of file